@@ -1,21 +1,35 @@
 """FileTalk Form Producer — entry point."""
 
-import json
+import os
 import sys
-from pathlib import Path
 
-import lionscliapp as app
-from lionscliapp import override_inputs
 
-from .app import run
+# Fixed part of the component ID card; per-instance keys are added on top.
+_CARD_TEMPLATE = {
+    "schema_version": 1,
+    "title": "FileTalk Form Producer",
+}
+
+
+# Config keys read by the commands below.
+_CTX_KEYS = ("path.outbox", "path.inbox", "channel")
+
+
+def _ctx_snapshot():
+    """Read all _CTX_KEYS from lionscliapp's ctx in one pass. Returns a dict."""
+    from lionscliapp import ctx
+    return {k: ctx.get(k) for k in _CTX_KEYS}
 
 
 def _run_command():
-    from lionscliapp import ctx, get_path
+    from lionscliapp import get_path
+
+    from .app import run  # pulls in tkinter; make-card never needs it
+    vals = _ctx_snapshot()
     config = {
-        "outbox": ctx.get("path.outbox"),    # Path (resolved by lionscliapp)
-        "inbox": ctx.get("path.inbox"),      # Path (resolved by lionscliapp)
-        "channel": ctx.get("channel"),       # str
+        "outbox": vals["path.outbox"],       # Path (resolved by lionscliapp)
+        "inbox": vals["path.inbox"],         # Path (resolved by lionscliapp)
+        "channel": vals["channel"],          # str
         "project_dir": get_path(".", "p"),   # Path to .form-producer/
     }
     run(config)
@@ -23,15 +37,18 @@ def _run_command():
 
 def _make_card_command():
     """Output a Patchboard component ID card describing this form-producer instance."""
-    from lionscliapp import ctx
+    from lionscliapp import override_inputs
 
-    inbox   = ctx.get("path.inbox")    # Path
-    outbox  = ctx.get("path.outbox")   # Path
-    channel = ctx.get("channel") or "output"
+    from .emitter import write_file_bytes
+    from .jsonfast import dumps_bytes
+
+    vals    = _ctx_snapshot()
+    inbox   = vals["path.inbox"]       # Path
+    outbox  = vals["path.outbox"]      # Path
+    channel = vals["channel"] or "output"
 
     card = {
-        "schema_version": 1,
-        "title": "FileTalk Form Producer",
+        **_CARD_TEMPLATE,
         "inbox":  str(inbox),
         "outbox": str(outbox),
         "channels": {
@@ -40,37 +57,80 @@ def _make_card_command():
         },
     }
 
+    payload = dumps_bytes(card, indent=True) + b"\n"
+
     # --card-path is a transient CLI option, not persisted to config.
+    # "--card-path -" writes the card to stdout, with no status line.
     card_path_str = override_inputs.cli_overrides.get("card-path")
+    if card_path_str == "-":
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.flush()
+        return
     if card_path_str:
-        out_path = Path(card_path_str)
+        out_path = card_path_str
     else:
-        out_path = Path.cwd() / "form-producer.card.json"
+        out_path = os.path.join(os.getcwd(), "form-producer.card.json")
 
     try:
-        out_path.write_text(json.dumps(card, indent=2) + "\n", encoding="utf-8")
+        write_file_bytes(out_path, payload)
     except OSError as e:
-        print(f"Error writing card to {out_path}: {e}", file=sys.stderr)
-        sys.exit(3)
+        sys.stderr.buffer.write(f"Error writing card to {out_path}: {e}\n".encode("utf-8"))
+        raise SystemExit(3)
 
     print(f"Card written to {out_path}")
 
 
-app.declare_app("form-producer", "0.1.0")
-app.describe_app("Turn a form-spec DSL into a live Tkinter form and emit Patchboard messages.")
-app.declare_projectdir(".form-producer")
-app.declare_key("path.outbox", ".form-producer/OUTBOX")
-app.describe_key("path.outbox", "OUTBOX directory path for emitted messages")
-app.declare_key("path.inbox", ".form-producer/INBOX")
-app.describe_key("path.inbox", "INBOX directory path to watch for incoming messages")
-app.declare_key("channel", "output")
-app.describe_key("channel", "Default output channel name")
-app.declare_cmd("", _run_command)
-app.declare_cmd("make-card", _make_card_command)
-app.describe_cmd("make-card", "Output a Patchboard component ID card. Pass --card-path to override output location.")
+# (key, default, description) for each persistent config key.
+_KEYS = (
+    ("path.outbox", ".form-producer/OUTBOX", "OUTBOX directory path for emitted messages"),
+    ("path.inbox",  ".form-producer/INBOX",  "INBOX directory path to watch for incoming messages"),
+    ("channel",     "output",                "Default output channel name"),
+)
+
+# (name, fn, description or None) for each command; "" is the default command.
+_CMDS = (
+    ("",          _run_command,       None),
+    ("make-card", _make_card_command,
+     "Output a Patchboard component ID card. Pass --card-path to override output location, or --card-path - for stdout."),
+)
+
+
+def _register():
+    """Declare the app, its config keys, and its commands with lionscliapp.
+
+    Kept out of module scope so that importing this module does not pull in
+    lionscliapp; the import happens only when main() actually runs the CLI.
+    """
+    import lionscliapp as app
+
+    app.declare_app("form-producer", "0.1.0")
+    app.describe_app("Turn a form-spec DSL into a live Tkinter form and emit Patchboard messages.")
+    app.declare_projectdir(".form-producer")
+    for key, default, description in _KEYS:
+        app.declare_key(key, default)
+        app.describe_key(key, description)
+    for name, fn, description in _CMDS:
+        if name and not _command_requested(name):
+            continue
+        app.declare_cmd(name, fn)
+        if description is not None:
+            app.describe_cmd(name, description)
+
+
+def _command_requested(name):
+    """True if argv names command name, or asks for help (which lists every command).
+
+    Named commands are only declared when they might run; the default
+    command is always declared.
+    """
+    args = sys.argv[1:]
+    return name in args or "help" in args
 
 
 def main():
+    import lionscliapp as app
+
+    _register()
     app.main()
 
 
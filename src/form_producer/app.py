@@ -7,18 +7,38 @@ import os
 import subprocess
 import sys
 import tkinter as tk
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox, ttk
 
 from .parser import ParseError, parse_spec
 from .emitter import EmitError, build_message, emit_message
 from .inbox import scan_inbox, is_text_message
+from .jsonfast import dumps as json_dumps
 
 
 # One canonical global bundle.
 g = {}
 
 _STATUS_SUCCESS_MS = 4000
-_INBOX_POLL_MS = 1000
+_RENDER_DEBOUNCE_MS = 120   # delay before a tab switch re-renders, so bursts coalesce
+_INBOX_POLL_MIN_MS = 250    # poll interval right after a message arrives
+_INBOX_POLL_MAX_MS = 4000   # ceiling the interval backs off to while idle
+_INBOX_BATCH = 3            # INBOX texts opened per event-loop turn
+_IO_POLL_MS = 20            # how often the Tk thread checks on background file I/O
+_ROW_BUILD_BATCH = 40       # new form rows built per event-loop turn
+
+_COURIER10 = ("Courier", 10)
+
+# Keypress validator for int fields, run by Tcl itself so typing never calls
+# into Python: allow '', '-', and an optional '-' followed by ASCII digits.
+_TCL_INT_PROC = r'proc ::_fp_int_prefix {s} {regexp {^-?[0-9]*$} $s}'
+
+# Field types seeded with today's date / the current time; see _reseed_clock_rows().
+_CLOCK_TYPES = frozenset(("date", "time"))
+
+# Field types whose widget stretches across the column (sticky="ew").
+_STRETCH_TYPES = frozenset(("text", "json", "choice"))
 
 _HINT_SYNTAX = '<identifier> -- <type>   # channel <ch>   # outbox <path>   # title <title>'
 _HINT_TYPES  = 'str<w>  text<w,h>  choice<a,b,...>  bool  int<w>  float<w>  json<w,h>  date  time  "fixed value"'
@@ -40,8 +60,16 @@ def run(config):
     """
     g["config"] = config
     g["tabs"] = []
+    g["tab_pos"] = {}           # id(tab) -> index in g["tabs"] / the notebook
+    g["current_tab"] = None     # selected tab, kept in step with the notebook
     g["untitled_count"] = 0
     g["status_clear_id"] = None
+    g["inbox_poll_ms"] = _INBOX_POLL_MIN_MS
+    g["inbox_queue"] = deque()  # (filepath, signal) of INBOX texts waiting to be opened
+    g["inbox_queued"] = set()   # filepaths currently in inbox_queue
+    g["inbox_drain_id"] = None  # after_idle id of the scheduled drain, if any
+    g["abspath_cache"] = {}
+    g["io_pool"] = ThreadPoolExecutor(max_workers=1)  # spec file reads/writes, run in order
     g["project_dir"] = config.get("project_dir")  # Path or None
 
     _setup_ui()
@@ -60,6 +88,7 @@ def _setup_ui():
     root.title("FileTalk Form Producer")
     root.minsize(700, 500)
     root.option_add('*tearOff', False)
+    root.tk.eval(_TCL_INT_PROC)
     g["root"] = root
 
     root.columnconfigure(0, weight=1)
@@ -152,8 +181,9 @@ def _build_menubar(root):
 
     # ── Patchboard ───────────────────────────────────────────────────────
     pb_menu = tk.Menu(menubar, tearoff=0)
+    g["emit_label"] = f"Emit JSON to: {_effective_channel()}"
     pb_menu.add_command(
-        label=f"Emit JSON to: {_effective_channel()}",
+        label=g["emit_label"],
         underline=0, accelerator="Ctrl+E",
         command=handle_emit,
     )
@@ -209,8 +239,11 @@ def _build_bottom_bar(root):
     bar.grid(row=4, column=0, sticky="ew")
     bar.columnconfigure(0, weight=1)
 
-    var = tk.StringVar(value="Ready — write a form spec above, then press Ctrl+Enter.")
+    msg = "Ready — write a form spec above, then press Ctrl+Enter."
+    var = tk.StringVar(value=msg)
     g["status_var"] = var
+    g["status_msg"] = msg
+    g["status_fg"] = None    # nothing applied yet; the first show_status sets it
     label = tk.Label(bar, textvariable=var, anchor="w", relief="sunken",
                      padx=4, font=("TkDefaultFont", 9))
     label.grid(row=0, column=0, sticky="ew", pady=2, padx=4)
@@ -222,8 +255,21 @@ def _build_bottom_bar(root):
 # ---------------------------------------------------------------------------
 
 def _current_tab():
-    idx = g["notebook"].index("current")
-    return g["tabs"][idx]
+    """Return the selected tab. Raises IndexError if there are no tabs."""
+    tab = g["current_tab"]
+    if tab is None:
+        raise IndexError("no tabs")
+    return tab
+
+
+def _select_tab_at(idx):
+    g["notebook"].select(idx)
+    g["current_tab"] = g["tabs"][idx]
+
+
+def _reindex_tabs():
+    """Rebuild g["tab_pos"] after g["tabs"] has been reordered or shrunk."""
+    g["tab_pos"] = {id(tab): idx for idx, tab in enumerate(g["tabs"])}
 
 
 def _new_tab(text="", filename=None):
@@ -233,9 +279,20 @@ def _new_tab(text="", filename=None):
         "number":     g["untitled_count"],
         "filename":   filename,
         "directives": {},
+        "cached_channel": None,   # _effective_channel() result, None = stale
+        "cached_outbox":  None,   # _effective_outbox() result, None = stale
         "fields":     None,
+        "parsed_text": None,      # DSL text that produced directives/fields
+        "rendered_fields": None,  # fields list currently built into the form
+        "render_after_id": None,  # pending _schedule_render() timer
+        "row_build_id": None,     # pending after_idle() building the rest of the rows
+        "collectors": [],         # (fid, field, collector) per rendered field, in order
+        "field_sigs": (),         # ((id, signature), ...) of the rendered rows
+        "labels":     {},
         "widgets":    {},
-        "vars":       {},
+        "vars":       {},         # fid -> Tk variable of a bool/fixed widget
+        "row_pool":   {},         # field type -> [(label, widget, var)] of retired rows
+        "text_cache": {},         # fid -> last contents read from a text/json widget
         "text_widget": None,
         "canvas":     None,
         "inner":      None,
@@ -254,7 +311,7 @@ def _new_tab(text="", filename=None):
     top_frame.columnconfigure(0, weight=1)
     top_frame.rowconfigure(0, weight=1)
 
-    text_widget = tk.Text(top_frame, font=("Courier", 10), wrap="none", undo=True)
+    text_widget = tk.Text(top_frame, font=_COURIER10, wrap="none", undo=True)
     text_widget.grid(row=0, column=0, sticky="nsew")
     if text:
         text_widget.insert("1.0", text)
@@ -291,9 +348,11 @@ def _new_tab(text="", filename=None):
     canvas.bind("<Button-5>",   lambda e: canvas.yview_scroll(1, "units"))
 
     # ── Register and select ───────────────────────────────────────────────
+    g["tab_pos"][id(tab)] = len(g["tabs"])
     g["tabs"].append(tab)
     g["notebook"].add(frame, text=_tab_label(tab))
     g["notebook"].select(frame)
+    g["current_tab"] = tab
 
     return tab
 
@@ -308,41 +367,78 @@ def _tab_label(tab):
 
 
 def _update_tab_label(tab):
-    idx = g["tabs"].index(tab)
+    idx = g["tab_pos"][id(tab)]
     g["notebook"].tab(idx, text=_tab_label(tab))
 
 
 def _on_tab_changed(event):
-    """Auto-render the form whenever a tab is selected."""
+    """Auto-render the form (debounced) whenever a tab is selected."""
     try:
-        tab = _current_tab()
+        tab = g["tabs"][g["notebook"].index("current")]
     except (IndexError, tk.TclError):
         return
-    _auto_render_tab(tab)
+    g["current_tab"] = tab
+    if _render_pending(tab):  # parsed while hidden; build it now it is on screen
+        _render_form_in_tab(tab, tab["fields"], focus=False)
+    _schedule_render(tab)
     _update_revert_state()
 
 
+def _schedule_render(tab):
+    """Run _auto_render_tab(tab) after _RENDER_DEBOUNCE_MS, replacing any pending run."""
+    _cancel_scheduled_render(tab)
+    tab["render_after_id"] = g["root"].after(_RENDER_DEBOUNCE_MS, _run_scheduled_render, tab)
+
+
+def _run_scheduled_render(tab):
+    tab["render_after_id"] = None
+    _auto_render_tab(tab)
+
+
+def _cancel_scheduled_render(tab):
+    if tab["render_after_id"] is not None:
+        g["root"].after_cancel(tab["render_after_id"])
+        tab["render_after_id"] = None
+
+
 def _auto_render_tab(tab):
-    """Parse the tab's DSL and render the form. Silent on parse failure."""
+    """Parse the tab's DSL and render the form. Silent on parse failure.
+
+    If the DSL text is unchanged since the last successful parse, it is
+    not parsed again.  A tab whose frame is not mapped (e.g. one of a burst
+    of INBOX tabs) is parsed but not rendered; _on_tab_changed builds its
+    form once it is selected.
+    """
+    _cancel_scheduled_render(tab)  # this render supersedes any pending one
     text = tab["text_widget"].get("1.0", "end-1c")
-    try:
-        directives, fields = parse_spec(text)
-    except ParseError:
-        return
-    tab["fields"] = fields
-    tab["directives"] = directives
-    _update_tab_label(tab)
-    _render_form_in_tab(tab, fields, focus=False)
+    if text != tab["parsed_text"] or tab["fields"] is None:
+        try:
+            directives, fields = parse_spec(text)
+        except ParseError:
+            return
+        tab["fields"] = fields
+        tab["parsed_text"] = text
+        _set_tab_directives(tab, directives)
+        _update_tab_label(tab)
+    if _render_pending(tab) and tab["frame"].winfo_ismapped():
+        _render_form_in_tab(tab, tab["fields"], focus=False)
     _update_emit_label()
 
 
+def _render_pending(tab):
+    """True if the tab has parsed fields that are not built into its form yet."""
+    return tab["fields"] is not None and tab["rendered_fields"] is not tab["fields"]
+
+
 def _update_emit_label():
     """Refresh the 'Emit JSON to: <channel>' menu item to reflect the current tab."""
     if "patchboard_menu" not in g:
         return
     tab = _safe_current_tab()
-    channel = _effective_channel(tab)
-    g["patchboard_menu"].entryconfig(0, label=f"Emit JSON to: {channel}")
+    label = f"Emit JSON to: {_effective_channel(tab)}"
+    if label != g["emit_label"]:  # skip the Tcl call (and menu redraw) if unchanged
+        g["patchboard_menu"].entryconfig(0, label=label)
+        g["emit_label"] = label
 
 
 def _build_card():
@@ -356,21 +452,17 @@ def _build_card():
     outbox          = g["config"].get("outbox") or "OUTBOX"
     default_channel = g["config"].get("channel") or "output"
 
-    out_channels = []
-    for tab in g.get("tabs") or []:
-        ch = tab["directives"].get("channel") or default_channel
-        if ch not in out_channels:
-            out_channels.append(ch)
-    if not out_channels:
-        out_channels.append(default_channel)
+    # dict.fromkeys dedupes in one pass while keeping first-seen order.
+    seen = dict.fromkeys(_effective_channel(tab) for tab in g.get("tabs") or [])
+    out_channels = list(seen) or [default_channel]
     if "card" not in out_channels:
         out_channels.append("card")
 
     return {
         "schema_version": 1,
         "title": "FileTalk Form Producer",
-        "inbox":  os.path.abspath(str(inbox)),
-        "outbox": os.path.abspath(str(outbox)),
+        "inbox":  _abspath(str(inbox)),
+        "outbox": _abspath(str(outbox)),
         "channels": {
             "in":  ["text"],
             "out": out_channels,
@@ -384,17 +476,23 @@ def _build_card():
 
 def handle_ctrl_enter(event):
     tab = _current_tab()
+    _cancel_scheduled_render(tab)
     text = tab["text_widget"].get("1.0", "end-1c")
-    try:
-        directives, fields = parse_spec(text)
-    except ParseError as e:
-        show_status(str(e), error=True)
-        return "break"
+    if text == tab["parsed_text"] and tab["fields"] is not None:
+        fields = tab["fields"]  # unchanged since the last parse
+    else:
+        try:
+            directives, fields = parse_spec(text)
+        except ParseError as e:
+            show_status(str(e), error=True)
+            return "break"
+        tab["fields"] = fields
+        tab["parsed_text"] = text
+        _set_tab_directives(tab, directives)
 
-    tab["fields"] = fields
-    tab["directives"] = directives
     _update_tab_label(tab)
     _render_form_in_tab(tab, fields)
+    _reseed_clock_rows(tab, fields)
     _update_emit_label()
 
     channel = _effective_channel(tab)
@@ -437,6 +535,9 @@ def handle_escape(event):
 
 
 def handle_exit():
+    # Let queued saves land first, so they are not mistaken for unsaved edits.
+    _wait_for_io()
+
     # Ask whether to save modified file-backed tabs.
     modified = [t for t in g["tabs"] if _tab_has_unsaved_changes(t)]
     if modified:
@@ -453,6 +554,7 @@ def handle_exit():
 
     # Auto-save session.
     _save_session()
+    g["io_pool"].shutdown(wait=True)  # let pending spec saves reach the disk
     g["root"].destroy()
 
 
@@ -465,9 +567,24 @@ def handle_revert_description():
     if not tab["filename"]:
         show_status("No file associated with this tab — cannot revert.", error=True)
         return
-    _load_file_into_tab(tab, tab["filename"])
+    # Read on the I/O pool so the revert sees any save still queued there.
+    path = tab["filename"]
+    _run_in_background(_read_text_file, (path,),
+                       lambda future: _finish_revert(future, tab, path))
+
+
+def _finish_revert(future, tab, path):
+    try:
+        content = future.result()
+    except OSError as e:
+        show_status(f"Could not open file: {e}", error=True)
+        return
+    if id(tab) not in g["tab_pos"]:
+        return  # tab was closed while the file was being read
+    tab["text_widget"].delete("1.0", "end")
+    tab["text_widget"].insert("1.0", content)
     _auto_render_tab(tab)
-    show_status(f"Reverted to {tab['filename']}")
+    show_status(f"Reverted to {path}")
 
 
 def handle_open_collection():
@@ -517,7 +634,7 @@ def handle_copy_json():
     if signal is None:
         return
 
-    json_str = json.dumps(signal, ensure_ascii=False, indent=2)
+    json_str = json_dumps(signal, indent=True)
     g["root"].clipboard_clear()
     g["root"].clipboard_append(json_str)
     show_status("JSON copied to clipboard.")
@@ -531,9 +648,13 @@ def handle_file_open():
     )
     if not path:
         return
+    _run_in_background(_read_text_file, (path,),
+                       lambda future: _finish_file_open(future, path))
+
+
+def _finish_file_open(future, path):
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = future.result()
     except OSError as e:
         show_status(f"Could not open file: {e}", error=True)
         return
@@ -567,9 +688,13 @@ def handle_tab_close():
         show_status("Cannot close the last tab.", error=True)
         return
     tab = _current_tab()
-    idx = g["tabs"].index(tab)
+    _cancel_scheduled_render(tab)
+    _cancel_row_build(tab)
+    idx = g["tab_pos"][id(tab)]
     g["notebook"].forget(tab["frame"])
     g["tabs"].pop(idx)
+    _reindex_tabs()
+    g["current_tab"] = g["tabs"][g["notebook"].index("current")]
 
 
 def handle_next_tab(event):
@@ -577,8 +702,8 @@ def handle_next_tab(event):
     if isinstance(g["root"].focus_get(), (tk.Text, tk.Entry, ttk.Combobox)):
         return
     if len(g["tabs"]) > 1:
-        idx = g["notebook"].index("current")
-        g["notebook"].select((idx + 1) % len(g["tabs"]))
+        idx = g["tab_pos"][id(_current_tab())]
+        _select_tab_at((idx + 1) % len(g["tabs"]))
     return "break"
 
 
@@ -587,8 +712,8 @@ def handle_prev_tab(event):
     if isinstance(g["root"].focus_get(), (tk.Text, tk.Entry, ttk.Combobox)):
         return
     if len(g["tabs"]) > 1:
-        idx = g["notebook"].index("current")
-        g["notebook"].select((idx - 1) % len(g["tabs"]))
+        idx = g["tab_pos"][id(_current_tab())]
+        _select_tab_at((idx - 1) % len(g["tabs"]))
     return "break"
 
 
@@ -628,14 +753,14 @@ def handle_emit_card():
 def handle_copy_card():
     """Copy the component ID card JSON to the clipboard."""
     card = _build_card()
-    json_str = json.dumps(card, indent=2)
+    json_str = json_dumps(card, indent=True)
     g["root"].clipboard_clear()
     g["root"].clipboard_append(json_str)
     show_status("Component card copied to clipboard.")
 
 
 def handle_open_inbox():
-    inbox_abs = os.path.abspath(str(_effective_inbox()))
+    inbox_abs = _abspath(str(_effective_inbox()))
     if not os.path.isdir(inbox_abs):
         try:
             os.makedirs(inbox_abs)
@@ -647,7 +772,7 @@ def handle_open_inbox():
 
 def handle_open_outbox():
     tab = _safe_current_tab()
-    outbox_abs = os.path.abspath(str(_effective_outbox(tab)))
+    outbox_abs = _abspath(str(_effective_outbox(tab)))
     if not os.path.isdir(outbox_abs):
         try:
             os.makedirs(outbox_abs)
@@ -671,103 +796,269 @@ def _first_editable_widget(tab):
     return None
 
 
+def _field_signature(field):
+    """Everything about a field that shapes its widget, apart from id and row."""
+    return (field["type"], field.get("width"), field.get("height"),
+            tuple(field.get("items") or ()), field.get("value"))
+
+
 def _render_form_in_tab(tab, fields, focus=True):
-    inner = tab["inner"]
+    """Bring the tab's form in line with fields.
+
+    Rows whose id and signature are unchanged keep their widgets (and the
+    values typed into them).  Rows that went away or changed are ungridded
+    into the tab's row pool, and new or changed rows reuse a pooled row of
+    their type where there is one, building fresh widgets only otherwise.
+    New rows beyond the first _ROW_BUILD_BATCH are placed on later
+    event-loop turns.
+    """
+    sigs = tuple((field["id"], _field_signature(field)) for field in fields)
+    if fields is not tab["rendered_fields"] and sigs != tab["field_sigs"]:
+        _rebuild_changed_rows(tab, fields, sigs)
+    tab["rendered_fields"] = fields
+    tab["collectors"] = [(field["id"], field, _COLLECTORS[field["type"]]) for field in fields]
 
-    for widget in inner.winfo_children():
-        widget.destroy()
-    tab["widgets"] = {}
-    tab["vars"] = {}
+    if focus:
+        widget = _first_editable_widget(tab)
+        if widget:
+            widget.focus_set()
 
-    inner.columnconfigure(0, weight=0)
-    inner.columnconfigure(1, weight=1)
 
-    first_widget = None
+def _reseed_clock_rows(tab, fields):
+    """Reset built date and time rows to today / now, as a fresh row would be.
 
-    for row, field in enumerate(fields):
+    Reused rows keep whatever they held, so without this a form left open
+    would go on emitting the date and time of its first render.
+    """
+    widgets = tab["widgets"]
+    for field in fields:
+        if field["type"] in _CLOCK_TYPES:
+            widget = widgets.get(field["id"])
+            if widget is not None:  # rows still to be built get seeded then
+                _WIDGET_RESETTERS[field["type"]](widget, field, None)
+
+
+def _rebuild_changed_rows(tab, fields, sigs):
+    labels = tab["labels"]
+    widgets = tab["widgets"]
+    _cancel_row_build(tab)
+
+    # Retire rows that went away or changed: ungrid them into the pool for
+    # their type, where _take_row() can reconfigure them for a new field.
+    new_sigs = dict(sigs)
+    for fid, sig in tab["field_sigs"]:
+        if fid in widgets and new_sigs.get(fid) != sig:  # rows never built are skipped
+            lbl = labels.pop(fid)
+            widget = widgets.pop(fid)
+            lbl.grid_forget()
+            widget.grid_forget()
+            row = (lbl, widget, tab["vars"].pop(fid, None))
+            tab["row_pool"].setdefault(sig[0], []).append(row)
+            tab["text_cache"].pop(fid, None)
+
+    tab["inner"].columnconfigure(0, weight=0)
+    tab["inner"].columnconfigure(1, weight=1)
+    tab["field_sigs"] = sigs
+    _place_rows(tab, fields, 0, _ROW_BUILD_BATCH)
+
+
+def _place_rows(tab, fields, start, budget):
+    """Grid fields[start:] into the form, building at most budget new rows.
+
+    Rows over budget are left for an after_idle() continuation so that a
+    large form paints (and the UI responds) before it is complete.
+    """
+    tab["row_build_id"] = None
+    labels = tab["labels"]
+    widgets = tab["widgets"]
+    resume_at = None
+
+    for row in range(start, len(fields)):
+        field = fields[row]
         fid = field["id"]
 
-        lbl = tk.Label(inner, text=fid + ":", font=("Courier", 10), anchor="w")
-        lbl.grid(row=row, column=0, sticky="w", padx=(6, 4), pady=3)
+        if fid in widgets:
+            lbl = labels[fid]
+            widget = widgets[fid]
+        elif budget:
+            budget -= 1
+            lbl, widget = _take_row(tab, field)
+            labels[fid] = lbl
+            widgets[fid] = widget
+        else:
+            if resume_at is None:
+                resume_at = row
+            continue
 
-        widget = _make_widget(inner, field, tab)
+        lbl.grid(row=row, column=0, sticky="w", padx=(6, 4), pady=3)
         # Entry-based widgets use sticky="w" so width= is respected.
         # Multi-line and choice widgets stretch full width.
-        if field["type"] in ("text", "json", "choice"):
+        if field["type"] in _STRETCH_TYPES:
             sticky = "ew"
         else:
             sticky = "w"
         widget.grid(row=row, column=1, sticky=sticky, padx=(0, 6), pady=3)
-        tab["widgets"][fid] = widget
 
-        if first_widget is None and field["type"] != "fixed":
-            first_widget = widget
+    if resume_at is not None:
+        tab["row_build_id"] = g["root"].after_idle(
+            _place_rows, tab, fields, resume_at, _ROW_BUILD_BATCH)
+        return
 
-    if first_widget is not None and focus:
-        first_widget.focus_set()
+    # Keep stacking order (and so Tab-key focus order) matching row order,
+    # since reused and late-built widgets may be out of creation order.
+    for field in fields:
+        labels[field["id"]].lift()
+        widgets[field["id"]].lift()
 
 
-def _make_widget(parent, field, tab):
-    ftype = field["type"]
+def _cancel_row_build(tab):
+    if tab["row_build_id"] is not None:
+        g["root"].after_cancel(tab["row_build_id"])
+        tab["row_build_id"] = None
 
-    if ftype == "str":
-        return tk.Entry(parent, width=field["width"], font=("Courier", 10))
 
-    if ftype == "text":
-        return tk.Text(parent, width=field["width"], height=field["height"],
-                       font=("Courier", 10), wrap="none")
+def _finish_row_build(tab):
+    """Build any rows still waiting on an after_idle() continuation, right now."""
+    if tab["row_build_id"] is not None:
+        _cancel_row_build(tab)
+        fields = tab["rendered_fields"]
+        _place_rows(tab, fields, 0, len(fields))
 
-    if ftype == "choice":
-        items = field["items"]
-        w = ttk.Combobox(parent, values=items, state="readonly", font=("Courier", 10))
-        w.set(items[0])
-        return w
 
-    if ftype == "bool":
-        var = tk.BooleanVar(value=False)
+def _take_row(tab, field):
+    """Return (label, widget) for field, reusing a retired row of its type if any."""
+    pool = tab["row_pool"].get(field["type"])
+    if not pool:
+        lbl = tk.Label(tab["inner"], text=field["id"] + ":", font=_COURIER10, anchor="w")
+        return lbl, _make_widget(tab["inner"], field, tab)
+    lbl, widget, var = pool.pop()
+    lbl.configure(text=field["id"] + ":")
+    if var is not None:
         tab["vars"][field["id"]] = var
-        return tk.Checkbutton(parent, variable=var)
+    _WIDGET_RESETTERS[field["type"]](widget, field, var)
+    return lbl, widget
 
-    if ftype == "int":
-        vcmd = (parent.register(_validate_int_keypress), '%P')
-        return tk.Entry(parent, width=field["width"], font=("Courier", 10),
-                        validate="key", validatecommand=vcmd)
 
-    if ftype == "float":
-        return tk.Entry(parent, width=field["width"], font=("Courier", 10))
+def _make_widget(parent, field, tab):
+    try:
+        builder = _WIDGET_BUILDERS[field["type"]]
+    except KeyError:
+        raise RuntimeError(f"Unknown field type: {field['type']!r}")
+    return builder(parent, field, tab)
 
-    if ftype == "json":
-        return tk.Text(parent, width=field["width"], height=field["height"],
-                       font=("Courier", 10), wrap="none")
 
-    if ftype == "date":
-        w = tk.Entry(parent, width=10, font=("Courier", 10))
-        w.insert(0, datetime.date.today().isoformat())
-        return w
+def _build_entry(parent, field, tab):  # str, float
+    return tk.Entry(parent, width=field["width"], font=_COURIER10)
 
-    if ftype == "time":
-        w = tk.Entry(parent, width=8, font=("Courier", 10))
-        w.insert(0, datetime.datetime.now().strftime("%H:%M:%S"))
-        return w
 
-    if ftype == "fixed":
-        var = tk.StringVar(value=field["value"])
-        return tk.Entry(parent, textvariable=var, state="readonly",
-                        font=("Courier", 10), fg="#555555",
-                        readonlybackground="#f0f0f0")
+def _build_text_area(parent, field, tab):  # text, json
+    return tk.Text(parent, width=field["width"], height=field["height"],
+                   font=_COURIER10, wrap="none")
 
-    raise RuntimeError(f"Unknown field type: {ftype!r}")
 
+def _build_choice(parent, field, tab):
+    items = field["items"]
+    w = ttk.Combobox(parent, values=items, state="readonly", font=_COURIER10)
+    w.set(items[0])
+    return w
 
-def _validate_int_keypress(new_value):
-    """Allow only characters that can appear in a base-10 integer."""
-    if new_value in ('', '-'):
-        return True
-    try:
-        int(new_value)
-        return True
-    except ValueError:
-        return False
+
+def _build_bool(parent, field, tab):
+    var = tk.BooleanVar(value=False)
+    tab["vars"][field["id"]] = var
+    return tk.Checkbutton(parent, variable=var)
+
+
+def _build_int(parent, field, tab):
+    return tk.Entry(parent, width=field["width"], font=_COURIER10,
+                    validate="key", validatecommand=("::_fp_int_prefix", "%P"))
+
+
+def _build_date(parent, field, tab):
+    w = tk.Entry(parent, width=10, font=_COURIER10)
+    w.insert(0, datetime.date.today().isoformat())
+    return w
+
+
+def _build_time(parent, field, tab):
+    w = tk.Entry(parent, width=8, font=_COURIER10)
+    w.insert(0, datetime.datetime.now().strftime("%H:%M:%S"))
+    return w
+
+
+def _build_fixed(parent, field, tab):
+    var = tk.StringVar(value=field["value"])
+    tab["vars"][field["id"]] = var
+    return tk.Entry(parent, textvariable=var, state="readonly",
+                    font=_COURIER10, fg="#555555",
+                    readonlybackground="#f0f0f0")
+
+
+# Field type -> function(parent, field, tab) returning the field's widget.
+_WIDGET_BUILDERS = {
+    "str":    _build_entry,
+    "text":   _build_text_area,
+    "choice": _build_choice,
+    "bool":   _build_bool,
+    "int":    _build_int,
+    "float":  _build_entry,
+    "json":   _build_text_area,
+    "date":   _build_date,
+    "time":   _build_time,
+    "fixed":  _build_fixed,
+}
+
+
+# Putting a retired widget back into the state its builder would have made
+# for a new field of the same type.
+
+def _reset_entry(widget, field, var):  # str, int, float
+    widget.configure(width=field["width"])
+    widget.delete(0, "end")
+
+
+def _reset_text_area(widget, field, var):  # text, json
+    widget.configure(width=field["width"], height=field["height"])
+    widget.delete("1.0", "end")
+    widget.edit_modified(False)
+
+
+def _reset_choice(widget, field, var):
+    widget.configure(values=field["items"])
+    widget.set(field["items"][0])
+
+
+def _reset_bool(widget, field, var):
+    var.set(False)
+
+
+def _reset_date(widget, field, var):
+    widget.delete(0, "end")
+    widget.insert(0, datetime.date.today().isoformat())
+
+
+def _reset_time(widget, field, var):
+    widget.delete(0, "end")
+    widget.insert(0, datetime.datetime.now().strftime("%H:%M:%S"))
+
+
+def _reset_fixed(widget, field, var):
+    var.set(field["value"])
+
+
+# Field type -> function(widget, field, var) reconfiguring a pooled widget.
+_WIDGET_RESETTERS = {
+    "str":    _reset_entry,
+    "text":   _reset_text_area,
+    "choice": _reset_choice,
+    "bool":   _reset_bool,
+    "int":    _reset_entry,
+    "float":  _reset_entry,
+    "json":   _reset_text_area,
+    "date":   _reset_date,
+    "time":   _reset_time,
+    "fixed":  _reset_fixed,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -780,82 +1071,126 @@ def _collect_values_from_tab(tab):
     Returns a signal dict on success, or None if validation fails
     (the error is shown in the status bar and the offending widget focused).
     """
+    _finish_row_build(tab)
     signal = {}
+    widgets = tab["widgets"]
 
-    for field in tab["fields"]:
-        fid   = field["id"]
-        ftype = field["type"]
-        widget = tab["widgets"][fid]
-        raw = _read_widget_from_tab(tab, fid, ftype)
+    for fid, field, collect in tab["collectors"]:
+        try:
+            signal[fid] = collect(tab, field, widgets[fid])
+        except _InvalidValue as e:
+            widgets[fid].focus_set()
+            show_status(f"'{fid}': {e}", error=True)
+            return None
 
-        if ftype == "bool":
-            signal[fid] = raw
+    return signal
 
-        elif ftype == "int":
-            try:
-                signal[fid] = int(raw.strip())
-            except ValueError:
-                widget.focus_set()
-                show_status(f"'{fid}': must be an integer", error=True)
-                return None
 
-        elif ftype == "float":
-            try:
-                val = float(raw.strip())
-            except ValueError:
-                widget.focus_set()
-                show_status(f"'{fid}': must be a number", error=True)
-                return None
-            if not math.isfinite(val):
-                widget.focus_set()
-                show_status(f"'{fid}': NaN and Infinity are not allowed", error=True)
-                return None
-            signal[fid] = val
-
-        elif ftype == "json":
-            try:
-                signal[fid] = json.loads(raw)
-            except json.JSONDecodeError as e:
-                widget.focus_set()
-                show_status(f"'{fid}': invalid JSON — {e}", error=True)
-                return None
+class _InvalidValue(Exception):
+    """Raised by a collector; the message follows "'<fid>': " in the status bar."""
 
-        elif ftype == "date":
-            try:
-                datetime.date.fromisoformat(raw.strip())
-            except ValueError:
-                widget.focus_set()
-                show_status(f"'{fid}': must be a date in yyyy-mm-dd format", error=True)
-                return None
-            signal[fid] = raw.strip()
-
-        elif ftype == "time":
-            try:
-                datetime.time.fromisoformat(raw.strip())
-            except ValueError:
-                widget.focus_set()
-                show_status(f"'{fid}': must be a time in hh:mm:ss format", error=True)
-                return None
-            signal[fid] = raw.strip()
 
-        elif ftype == "fixed":
-            signal[fid] = field["value"]
+def _collect_entry(tab, field, widget):  # str, choice
+    return widget.get()
 
-        else:  # str, text, choice
-            signal[fid] = raw
 
-    return signal
+def _collect_text(tab, field, widget):
+    return _read_text_widget(tab, field["id"])
+
+
+def _collect_json(tab, field, widget):
+    try:
+        return json.loads(_read_text_widget(tab, field["id"]),
+                          parse_float=_json_finite_float,
+                          parse_constant=_json_reject_constant)
+    except json.JSONDecodeError as e:
+        raise _InvalidValue(f"invalid JSON — {e}")
+
 
+def _json_finite_float(s):
+    val = float(s)
+    if not math.isfinite(val):  # e.g. 1e999
+        _json_reject_constant(s)
+    return val
 
-def _read_widget_from_tab(tab, fid, ftype):
-    """Read the raw value from a widget."""
-    if ftype == "bool":
-        return tab["vars"][fid].get()
-    if ftype in ("text", "json"):
-        return tab["widgets"][fid].get("1.0", "end-1c")
-    if ftype == "fixed":
-        return None  # handled directly from field["value"]
-    return tab["widgets"][fid].get()
+
+def _json_reject_constant(s):  # NaN, Infinity, -Infinity
+    raise _InvalidValue("NaN and Infinity are not allowed")
+
+
+def _collect_bool(tab, field, widget):
+    return tab["vars"][field["id"]].get()
+
+
+def _collect_int(tab, field, widget):
+    try:
+        return int(widget.get().strip())
+    except ValueError:
+        raise _InvalidValue("must be an integer")
+
+
+def _collect_float(tab, field, widget):
+    try:
+        val = float(widget.get().strip())
+    except ValueError:
+        raise _InvalidValue("must be a number")
+    if not math.isfinite(val):
+        raise _InvalidValue("NaN and Infinity are not allowed")
+    return val
+
+
+def _collect_date(tab, field, widget):
+    raw = widget.get().strip()
+    try:
+        datetime.date.fromisoformat(raw)
+    except ValueError:
+        raise _InvalidValue("must be a date in yyyy-mm-dd format")
+    return raw
+
+
+def _collect_time(tab, field, widget):
+    raw = widget.get().strip()
+    try:
+        datetime.time.fromisoformat(raw)
+    except ValueError:
+        raise _InvalidValue("must be a time in hh:mm:ss format")
+    return raw
+
+
+def _collect_fixed(tab, field, widget):
+    return field["value"]
+
+
+# Field type -> function(tab, field, widget) returning the field's value for
+# the signal, or raising _InvalidValue.  Looked up once per render, not per emit.
+_COLLECTORS = {
+    "str":    _collect_entry,
+    "text":   _collect_text,
+    "choice": _collect_entry,
+    "bool":   _collect_bool,
+    "int":    _collect_int,
+    "float":  _collect_float,
+    "json":   _collect_json,
+    "date":   _collect_date,
+    "time":   _collect_time,
+    "fixed":  _collect_fixed,
+}
+
+
+def _read_text_widget(tab, fid):
+    """Return a Text widget's contents, reusing the last read if it hasn't been edited.
+
+    Tk's modified flag is set synchronously by every insert/delete, so it
+    serves as the dirty bit; it is cleared here after each fresh read.
+    """
+    widget = tab["widgets"][fid]
+    cache = tab["text_cache"]
+    if fid in cache and not widget.tk.getboolean(widget.edit_modified()):
+        return cache[fid]
+    value = widget.get("1.0", "end-1c")
+    cache[fid] = value
+    widget.edit_modified(False)
+    return value
 
 
 # ---------------------------------------------------------------------------
@@ -872,10 +1207,8 @@ def _session_path():
 
 def _build_collection():
     """Serialise the current tab state to a dict."""
-    try:
-        active_index = g["notebook"].index("current")
-    except tk.TclError:
-        active_index = 0
+    tab = g["current_tab"]
+    active_index = g["tab_pos"][id(tab)] if tab is not None else 0
     tabs_data = []
     for tab in g["tabs"]:
         tabs_data.append({
@@ -893,8 +1226,12 @@ def _restore_collection(data):
 
     # Remove all current tabs.
     for tab in list(g["tabs"]):
+        _cancel_scheduled_render(tab)
+        _cancel_row_build(tab)
         g["notebook"].forget(tab["frame"])
     g["tabs"].clear()
+    g["tab_pos"].clear()
+    g["current_tab"] = None
     g["untitled_count"] = 0
 
     tabs_data = data.get("tabs") or []
@@ -906,11 +1243,11 @@ def _restore_collection(data):
         filename = tab_data.get("filename")
         text     = tab_data.get("text") or ""
         _new_tab(text=text, filename=filename)
-        # _on_tab_changed → _auto_render_tab fires automatically on select.
+        # _on_tab_changed → _schedule_render fires automatically on select.
 
     active = data.get("active_index", 0)
     if 0 <= active < len(g["tabs"]):
-        g["notebook"].select(active)
+        _select_tab_at(active)
 
     _update_revert_state()
 
@@ -970,20 +1307,67 @@ def _update_revert_state():
 # ---------------------------------------------------------------------------
 
 def _start_inbox_polling():
-    g["root"].after(_INBOX_POLL_MS, _poll_inbox)
+    g["root"].after(g["inbox_poll_ms"], _poll_inbox)
 
 
 def _poll_inbox():
-    inbox_path = str(_effective_inbox())
-    for filepath, message in scan_inbox(inbox_path):
-        if is_text_message(message):
-            _handle_inbox_text(message['signal'])
-        # Delete every successfully parsed message regardless of channel.
-        try:
-            os.remove(filepath)
-        except OSError:
-            pass
-    g["root"].after(_INBOX_POLL_MS, _poll_inbox)
+    """Process the INBOX, then reschedule.
+
+    The interval doubles after every empty scan, up to _INBOX_POLL_MAX_MS,
+    and drops back to _INBOX_POLL_MIN_MS as soon as a message is seen.
+    """
+    results = []
+    try:
+        results = scan_inbox(str(_effective_inbox()))
+        queued = g["inbox_queued"]
+        for filepath, message in results:
+            if filepath in queued:
+                continue  # still waiting in the queue from an earlier poll
+            if is_text_message(message):
+                # The file stays on disk until its text has been opened.
+                g["inbox_queue"].append((filepath, message['signal']))
+                queued.add(filepath)
+            else:
+                # Delete every other parsed message regardless of channel.
+                _unlink_quietly(filepath)
+        if g["inbox_queue"] and g["inbox_drain_id"] is None:
+            g["inbox_drain_id"] = g["root"].after_idle(_drain_inbox_queue)
+    finally:
+        if results:
+            g["inbox_poll_ms"] = _INBOX_POLL_MIN_MS
+        else:
+            g["inbox_poll_ms"] = min(g["inbox_poll_ms"] * 2, _INBOX_POLL_MAX_MS)
+        g["root"].after(g["inbox_poll_ms"], _poll_inbox)
+
+
+def _drain_inbox_queue():
+    """Open up to _INBOX_BATCH queued INBOX texts, and come back when idle for the rest.
+
+    Spreading a burst of messages across event-loop turns keeps the UI
+    responsive while the tabs are being created.  Each file is deleted once
+    its text has been handed to a tab, even if that fails, and the drain
+    reschedules itself whatever happens.
+    """
+    g["inbox_drain_id"] = None
+    queue = g["inbox_queue"]
+    try:
+        for _ in range(min(_INBOX_BATCH, len(queue))):
+            filepath, text = queue.popleft()
+            g["inbox_queued"].discard(filepath)
+            try:
+                _handle_inbox_text(text)
+            finally:
+                _unlink_quietly(filepath)
+    finally:
+        if queue and g["inbox_drain_id"] is None:
+            g["inbox_drain_id"] = g["root"].after_idle(_drain_inbox_queue)
+
+
+def _unlink_quietly(filepath):
+    try:
+        os.unlink(filepath)
+    except OSError:
+        pass
 
 
 def _handle_inbox_text(text):
@@ -991,26 +1375,52 @@ def _handle_inbox_text(text):
     tab = _new_tab(text=text)
     _auto_render_tab(tab)
     count = len(tab["fields"]) if tab["fields"] is not None else 0
-    show_status(f"INBOX: received text message, rendered {count} field(s).")
+    show_status(f"INBOX: received text message, parsed {count} field(s).")
 
 
 # ---------------------------------------------------------------------------
 # Config resolution
 # ---------------------------------------------------------------------------
 
+def _set_tab_directives(tab, directives):
+    """Install freshly parsed directives on a tab, invalidating its cached config."""
+    tab["directives"] = directives
+    tab["cached_channel"] = None
+    tab["cached_outbox"] = None
+
+
 def _effective_channel(tab=None):
-    """DSL directive > configured channel > default 'output'."""
+    """DSL directive > configured channel > default 'output'.
+
+    The result is cached on the tab until its directives change.
+    """
+    if tab and tab["cached_channel"] is not None:
+        return tab["cached_channel"]
     if tab and tab["directives"].get("channel"):
-        return tab["directives"]["channel"]
-    return g["config"].get("channel") or "output"
+        channel = tab["directives"]["channel"]
+    else:
+        channel = g["config"].get("channel") or "output"
+    if tab:
+        tab["cached_channel"] = channel
+    return channel
 
 
 def _effective_outbox(tab=None):
-    """DSL directive > configured outbox > default 'OUTBOX'."""
+    """DSL directive > configured outbox > default 'OUTBOX'.
+
+    The result is cached on the tab until its directives change.
+    """
+    if tab and tab["cached_outbox"] is not None:
+        return tab["cached_outbox"]
     if tab and tab["directives"].get("outbox"):
-        return tab["directives"]["outbox"]
-    outbox = g["config"].get("outbox")
-    return outbox if outbox is not None else "OUTBOX"
+        outbox = tab["directives"]["outbox"]
+    else:
+        outbox = g["config"].get("outbox")
+        if outbox is None:
+            outbox = "OUTBOX"
+    if tab:
+        tab["cached_outbox"] = outbox
+    return outbox
 
 
 def _effective_inbox():
@@ -1021,38 +1431,71 @@ def _effective_inbox():
 
 def _safe_current_tab():
     """Return current tab, or None if the notebook has no tabs."""
-    try:
-        return _current_tab()
-    except (IndexError, tk.TclError):
-        return None
+    return g["current_tab"]
 
 
 # ---------------------------------------------------------------------------
 # Filesystem helpers
 # ---------------------------------------------------------------------------
 
-def _load_file_into_tab(tab, path):
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except OSError as e:
-        show_status(f"Could not open file: {e}", error=True)
-        return
-    tab["text_widget"].delete("1.0", "end")
-    tab["text_widget"].insert("1.0", content)
+def _abspath(path):
+    """os.path.abspath(path), memoised; the working directory never changes while running."""
+    cache = g["abspath_cache"]
+    result = cache.get(path)
+    if result is None:
+        result = cache[path] = os.path.abspath(path)
+    return result
 
 
 def _write_spec_file(tab, path):
+    """Save the tab's DSL to path on the I/O pool; the outcome goes to the status bar."""
     content = tab["text_widget"].get("1.0", "end-1c")
+    _run_in_background(_write_text_file, (path, content),
+                       lambda future: _finish_spec_write(future, path))
+
+
+def _finish_spec_write(future, path):
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        future.result()
     except OSError as e:
         show_status(f"Could not save file: {e}", error=True)
         return
     show_status(f"Saved {path}")
 
 
+def _read_text_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _write_text_file(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _run_in_background(fn, args, on_done):
+    """Run fn(*args) on the I/O pool, then call on_done(future) on the Tk thread.
+
+    Worker threads never touch Tk; the future is polled from the main loop.
+    """
+    _await_future(g["io_pool"].submit(fn, *args), on_done)
+
+
+def _wait_for_io():
+    """Block until every spec read/write already on the I/O pool has finished.
+
+    The pool has one worker, so a no-op submitted now runs after all of them.
+    """
+    g["io_pool"].submit(lambda: None).result()
+
+
+def _await_future(future, on_done):
+    if future.done():
+        on_done(future)
+    else:
+        g["root"].after(_IO_POLL_MS, _await_future, future, on_done)
+
+
 def _file_dialog_initialdir():
     project_dir = g.get("project_dir")
     if project_dir is not None:
@@ -1065,13 +1508,19 @@ def _file_dialog_initialdir():
 
 
 def _open_directory(path):
-    """Open path in the OS file manager."""
+    """Open path in the OS file manager without waiting for it to start."""
     if sys.platform == "win32":
         os.startfile(path)
-    elif sys.platform == "darwin":
-        subprocess.run(["open", path])
-    else:
-        subprocess.run(["xdg-open", path])
+        return
+    launcher = "open" if sys.platform == "darwin" else "xdg-open"
+    try:
+        subprocess.Popen(
+            [launcher, path],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            close_fds=True, start_new_session=True,
+        )
+    except OSError as e:
+        show_status(f"Could not run {launcher}: {e}", error=True)
 
 
 # ---------------------------------------------------------------------------
@@ -1083,14 +1532,22 @@ def show_status(msg, error=False):
         g["root"].after_cancel(g["status_clear_id"])
         g["status_clear_id"] = None
 
-    g["status_var"].set(msg)
-    g["status_label"].configure(fg="red" if error else "black")
+    _apply_status(msg, "red" if error else "black")
 
     if not error:
         g["status_clear_id"] = g["root"].after(_STATUS_SUCCESS_MS, _clear_status)
 
 
 def _clear_status():
-    g["status_var"].set("")
-    g["status_label"].configure(fg="black")
+    _apply_status("", "black")
     g["status_clear_id"] = None
+
+
+def _apply_status(msg, fg):
+    """Push msg and fg to the status bar, skipping whatever is already shown."""
+    if msg != g["status_msg"]:
+        g["status_var"].set(msg)
+        g["status_msg"] = msg
+    if fg != g["status_fg"]:
+        g["status_label"].configure(fg=fg)
+        g["status_fg"] = fg
@@ -1,48 +1,155 @@
 """Message building and file writing."""
 
-import json
+import errno
 import os
+import threading
 import time
-import uuid
+
+from .jsonfast import dumps_bytes
+
+
+# os.open flags for writing a whole file; O_BINARY stops newline translation on Windows.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# OUTBOX directories already created (or found) by this process.
+_ENSURED_DIRS = set()
+
+# Random bytes for message filenames, fetched from os.urandom 4 KiB at a time.
+_RAND_BUF = b""
+_RAND_POS = 0
+_RAND_LOCK = threading.Lock()
 
 
 class EmitError(Exception):
     pass
 
 
+def _uuid4_str():
+    """Return a random (version 4) UUID string, like str(uuid.uuid4())."""
+    return _uuid4_strs(1)[0]
+
+
+def _uuid4_strs(n):
+    """Return a list of n random UUID strings, drawing their bytes in one go."""
+    global _RAND_BUF, _RAND_POS
+    size = 16 * n
+    with _RAND_LOCK:
+        if _RAND_POS + size > len(_RAND_BUF):
+            _RAND_BUF = os.urandom(max(4096, size))
+            _RAND_POS = 0
+        raw = bytearray(_RAND_BUF[_RAND_POS:_RAND_POS + size])
+        _RAND_POS += size
+    names = []
+    for i in range(0, size, 16):
+        raw[i + 6] = (raw[i + 6] & 0x0f) | 0x40  # version 4
+        raw[i + 8] = (raw[i + 8] & 0x3f) | 0x80  # RFC 4122 variant
+        h = raw[i:i + 16].hex()
+        names.append(f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}")
+    return names
+
+
+def _discard_rand_buf():
+    # A forked child must not hand out the same names as its parent.
+    global _RAND_BUF, _RAND_POS
+    _RAND_BUF = b""
+    _RAND_POS = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_discard_rand_buf)
+
+
 def build_message(signal, channel):
     """Build and return a Patchboard core message dict."""
     return {
         "channel": channel,
-        "timestamp": str(time.time()),
+        "timestamp": _timestamp_str(),
         "signal": signal,
     }
 
 
+def _timestamp_str():
+    """Unix time as a string with six decimals, e.g. '1708732800.123456'.
+
+    Formatted from time.time_ns() with integer arithmetic: no float, so no
+    rounding artefacts or exponent notation.
+    """
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    return f"{seconds}.{micros:06d}"
+
+
 def write_message(message, outbox_path):
     """Write a Patchboard message dict to outbox_path as <uuid4>.json.
 
     Writes directly to the final filename (no temp-file + rename) per the
     file-transport profile.  Returns the written filename (basename only).
     """
-    try:
-        os.makedirs(outbox_path, exist_ok=True)
-    except OSError as e:
-        raise EmitError(f"Cannot create OUTBOX directory '{outbox_path}': {e}")
+    _ensure_dir(outbox_path)
+    filename = _uuid4_str() + ".json"
+    _write_file(outbox_path, filename, dumps_bytes(message) + b"\n")
+    return filename
 
-    filename = str(uuid.uuid4()) + ".json"
-    filepath = os.path.join(outbox_path, filename)
 
+def _write_file(outbox_path, filename, payload):
+    """Write payload bytes to outbox_path/filename, raising EmitError on failure."""
+    filepath = os.path.join(outbox_path, filename)
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(message, f, ensure_ascii=False)
-            f.write('\n')
+        try:
+            write_file_bytes(filepath, payload)
+        except FileNotFoundError:
+            # OUTBOX was removed since we made it; make it again, once.
+            _ENSURED_DIRS.discard(outbox_path)
+            _ensure_dir(outbox_path)
+            write_file_bytes(filepath, payload)
     except OSError as e:
         raise EmitError(f"Cannot write file '{filepath}': {e}")
 
-    return filename
+
+def write_file_bytes(path, data):
+    """Create or truncate the file at path and write all of data to it.
+
+    Continues after short writes.  Raises OSError on failure, including a
+    write that makes no progress.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            if written == 0:
+                raise OSError(errno.EIO, "write made no progress")
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _ensure_dir(outbox_path):
+    """makedirs(outbox_path), skipped if this process already did it."""
+    if outbox_path in _ENSURED_DIRS:
+        return
+    try:
+        os.makedirs(outbox_path, exist_ok=True)
+    except OSError as e:
+        raise EmitError(f"Cannot create OUTBOX directory '{outbox_path}': {e}")
+    _ENSURED_DIRS.add(outbox_path)
 
 
 def emit_message(signal, channel, outbox_path):
     """Build and write a Patchboard message. Returns the written filename."""
     return write_message(build_message(signal, channel), outbox_path)
+
+
+def emit_messages(signals, channel, outbox_path):
+    """Build and write one Patchboard message per signal, in order.
+
+    Like calling emit_message() for each signal, but the OUTBOX check and
+    the random bytes for the filenames are shared by the whole batch.
+    Returns the written filenames.  On EmitError, files already written
+    stay in place.
+    """
+    signals = list(signals)
+    _ensure_dir(outbox_path)
+    filenames = [name + ".json" for name in _uuid4_strs(len(signals))]
+    for signal, filename in zip(signals, filenames):
+        _write_file(outbox_path, filename, dumps_bytes(build_message(signal, channel)) + b"\n")
+    return filenames
@@ -1,7 +1,27 @@
 """INBOX directory scanning for Patchboard file-transport messages."""
 
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .jsonfast import loads
+
+
+_READ_WORKERS = 8       # threads reading INBOX files in parallel
+_PARALLEL_MIN = 4       # fewer new files than this are read inline
+_read_pool = None       # ThreadPoolExecutor, created on first big scan
+
+_UNREADABLE = object()  # _load() result for a file that could not be read
+
+# A complete message is a JSON object, so its last byte is '}' or trailing
+# whitespace.  Any other last byte means the sender is still writing.
+_COMPLETE_TAIL = frozenset(b'}\n\r\t ')
+
+
+# (path, st_ino, st_mtime_ns, st_size) -> message dict, or None if the file
+# did not parse.  Lets a poll skip files that have not changed since the
+# last one, typically a sender's half-written file.  The path is part of the
+# key because inode numbers are reused and mtimes can be coarse.
+_PARSE_CACHE = {}
 
 
 def scan_inbox(inbox_path):
@@ -10,31 +30,90 @@ def scan_inbox(inbox_path):
     Returns a list of (filepath, message_dict) for each .json file that
     successfully parses as a JSON object.  Files that fail to parse are
     skipped and left in place (they may be incomplete; retry on next poll).
+    Only regular files are considered; directories, sockets and symlinks
+    are ignored.  A missing or unreadable inbox_path yields [].  Files
+    whose stat is unchanged since the previous scan are not read again.
     """
-    if not os.path.isdir(inbox_path):
-        return []
-
+    global _PARSE_CACHE
     try:
-        entries = sorted(os.listdir(inbox_path))
+        with os.scandir(inbox_path) as it:
+            # d_type answers is_file() without a stat on most filesystems.
+            entries = [e for e in it
+                       if e.name.endswith('.json') and e.is_file(follow_symlinks=False)]
     except OSError:
         return []
+    entries.sort(key=lambda e: e.name)
 
-    results = []
-    for filename in entries:
-        if not filename.endswith('.json'):
-            continue
-        filepath = os.path.join(inbox_path, filename)
+    keys = []
+    for entry in entries:
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except (OSError, json.JSONDecodeError):
-            continue  # incomplete or unreadable — retry next poll
-        if isinstance(data, dict):
-            results.append((filepath, data))
+            st = entry.stat()
+        except OSError:
+            continue  # vanished — nothing to do
+        keys.append((entry.path, st.st_ino, st.st_mtime_ns, st.st_size))
+
+    # Read new or changed files, overlapping the reads when there are many
+    # (open/read release the GIL; orjson parses in C).
+    to_read = [key for key in keys if key not in _PARSE_CACHE]
+    paths = [key[0] for key in to_read]
+    sizes = [key[3] for key in to_read]
+    if len(to_read) >= _PARALLEL_MIN:
+        loaded = dict(zip(paths, _get_read_pool().map(_load, paths, sizes)))
+    else:
+        loaded = {path: _load(path, size) for path, size in zip(paths, sizes)}
+
+    results = []
+    cache = {}
+    for key in keys:
+        data = _PARSE_CACHE[key] if key in _PARSE_CACHE else loaded[key[0]]
+        if data is _UNREADABLE:
+            continue  # retry next poll
+        cache[key] = data
+        if data is not None:
+            results.append((key[0], data))
 
+    _PARSE_CACHE = cache  # forget files that have gone away
     return results
 
 
+def _get_read_pool():
+    global _read_pool
+    if _read_pool is None:
+        _read_pool = ThreadPoolExecutor(max_workers=_READ_WORKERS,
+                                        thread_name_prefix="inbox-read")
+    return _read_pool
+
+
+def _load(filepath, size):
+    try:
+        return _read_message(filepath, size)
+    except OSError:
+        return _UNREADABLE
+
+
+def _read_message(filepath, size):
+    """Return the JSON object in filepath, or None if it is not one.
+
+    size is the file's size when it was listed.  Empty files and files
+    whose last byte cannot end a JSON object are rejected without being
+    read in full or parsed.
+    """
+    if size == 0:
+        return None
+    with open(filepath, 'rb') as f:
+        f.seek(size - 1)
+        tail = f.read(1)
+        if not tail or tail[0] not in _COMPLETE_TAIL:
+            return None  # still being written — retry once it changes
+        f.seek(0)
+        raw = f.read()
+    try:
+        data = loads(raw)
+    except ValueError:
+        return None  # incomplete or undecodable — retry once it changes
+    return data if isinstance(data, dict) else None
+
+
 def is_text_message(message):
     """Return True if message is a channel='text' Patchboard message with a string signal."""
     return (
@@ -0,0 +1,64 @@
+"""JSON encoding and decoding, using orjson when it is installed."""
+
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_bytes(obj, indent=False):
+    """Serialise obj to UTF-8 JSON bytes (no trailing newline).
+
+    Uses orjson when available, falling back to the stdlib json module if
+    orjson is not installed or cannot encode obj (e.g. integers beyond 64
+    bits).  Non-ASCII text is written as-is, never \\u-escaped.  NaN and
+    Infinity come out as stdlib writes them either way (orjson alone would
+    write null).
+    """
+    if orjson is not None:
+        try:
+            out = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass  # orjson.JSONEncodeError — let stdlib have a go
+        else:
+            # orjson writes non-finite floats as null, so only output with a
+            # null in it needs the (slower) check.
+            if b'null' not in out or not _has_non_finite(obj):
+                return out
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def _has_non_finite(obj):
+    """Return True if obj contains a NaN or infinite float anywhere."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def dumps(obj, indent=False):
+    """Serialise obj to a JSON str; see dumps_bytes()."""
+    return dumps_bytes(obj, indent).decode('utf-8')
+
+
+def loads(data):
+    """Parse UTF-8 JSON bytes (or str).
+
+    Uses orjson when available.  Input orjson rejects but stdlib json
+    accepts (NaN, Infinity) is retried with stdlib.  Raises ValueError
+    (json.JSONDecodeError, or UnicodeDecodeError for bad UTF-8) if the
+    data is not JSON.  orjson turns integers beyond 64 bits into floats,
+    so do not use this where such values must survive exactly.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
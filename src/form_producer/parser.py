@@ -1,23 +1,57 @@
 """FormSpec DSL parser."""
 
+import functools
+import re
+import sys
 
-class ParseError(Exception):
-    pass
+
+# A stripped type spec: a quoted fixed value, or a type name with optional
+# <params>.  close is '' when the closing '>' is missing.  The only specs
+# that do not match are malformed fixed values: a '"' with no closing '"'.
+_TYPE_SPEC_RE = re.compile(
+    r'"(?P<fixed>.*)"'
+    r'|(?P<name>(?:[^"<][^<]*?)?)\s*(?:<(?P<params>.*?)(?P<close>>?))?')
+
+# <w> and <w,h> parameters: ASCII integers, optionally signed and padded.
+_INT_PARAM_RE = re.compile(r'\s*([+-]?[0-9]+)\s*')
+_TWO_INT_PARAMS_RE = re.compile(r'\s*([+-]?[0-9]+)\s*,\s*([+-]?[0-9]+)\s*')
+
+# A stripped '#' line that sets a directive; any other '#' line is a comment.
+_DIRECTIVE_RE = re.compile(r'#\s*(channel|outbox|title):\s*(.*?)')
+
+
+class ParseError(ValueError):
+    """Malformed DSL text.  The message is the whole story: 'Line N: reason'."""
 
 
 def parse_spec(text):
     """Parse DSL text into (directives, fields).
 
     Returns:
-        directives: dict with optional 'channel' and 'outbox' keys
+        directives: dict with optional 'channel', 'outbox' and 'title' keys
         fields: ordered list of field dicts, each with 'id', 'type', and
                 type-specific parameter keys
 
     Raises:
         ParseError with message including line number and reason
+
+    Every call returns new dicts and lists, which the caller may mutate,
+    even when the parse itself comes from the cache.
+    """
+    directives, rows = _parse_cached(text)
+    return dict(directives), [_make_field(identifier, template) for identifier, template in rows]
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(text):
+    """parse_spec() with shared, never-mutated results: (directive items, (id, template) rows).
+
+    Editors and tests parse the same text over and over; a repeat costs one
+    cache lookup plus the copies parse_spec() makes.  Failed parses are not
+    cached (lru_cache does not store exceptions).
     """
     directives = {}
-    fields = []
+    rows = []
     seen_ids = set()
 
     for lineno, raw_line in enumerate(text.splitlines(), 1):
@@ -26,15 +60,16 @@ def parse_spec(text):
         if not line:
             continue
 
-        if line.startswith('#'):
-            _parse_directive_line(line, directives)
+        if line[0] == '#':
+            m = _DIRECTIVE_RE.fullmatch(line)
+            if m and m[2]:
+                directives[m[1]] = m[2]
             continue
 
-        if '--' not in line:
+        parts = _split_field_line(line)
+        if parts is None:
             raise ParseError(f"Line {lineno}: missing '--' separator")
-
-        left, _, right = line.partition('--')
-        identifier = left.strip()
+        identifier, type_spec = parts
 
         if not identifier:
             raise ParseError(f"Line {lineno}: empty identifier")
@@ -43,123 +78,145 @@ def parse_spec(text):
             raise ParseError(f"Line {lineno}: duplicate identifier '{identifier}'")
         seen_ids.add(identifier)
 
-        type_spec_raw = right.strip()
-        if '#' in type_spec_raw:
-            type_spec_raw = type_spec_raw[:type_spec_raw.index('#')].strip()
+        rows.append((identifier, _template_for(type_spec, identifier, lineno)))
 
-        field = _parse_type_spec(type_spec_raw, identifier, lineno)
-        field['id'] = identifier
-        fields.append(field)
+    return tuple(directives.items()), tuple(rows)
 
-    return directives, fields
 
+@functools.lru_cache(maxsize=4096)
+def _split_field_line(line):
+    """Return (identifier, type_spec) for a stripped field line, or None if it has no '--'.
 
-def _parse_directive_line(line, directives):
-    """Parse a # directive line and update directives dict in place."""
-    content = line[1:].strip()
-    if content.startswith('channel:'):
-        value = content[len('channel:'):].strip()
-        if value:
-            directives['channel'] = value
-    elif content.startswith('outbox:'):
-        value = content[len('outbox:'):].strip()
-        if value:
-            directives['outbox'] = value
-    elif content.startswith('title:'):
-        value = content[len('title:'):].strip()
-        if value:
-            directives['title'] = value
-    # else: plain comment, ignored
+    Memoized: an edit changes one line, and every other line of the spec
+    comes straight back from the cache on the next parse.
+    """
+    identifier, sep, spec = line.partition('--')
+    if not sep:
+        return None
+    spec = spec.lstrip()
+    hash_at = spec.find('#')
+    if hash_at >= 0:
+        if spec[0] == '"':
+            # A '#' before the quote closing a fixed value is part of the value.
+            close_at = spec.find('"', 1)
+            if close_at > hash_at:
+                hash_at = spec.find('#', close_at)
+        if hash_at >= 0:
+            spec = spec[:hash_at].rstrip()
+    return identifier.rstrip(), spec
+
+
+def _template_for(type_spec, identifier, lineno):
+    """Return the shared field template for type_spec, or raise ParseError."""
+    template, problem = _type_spec_template(type_spec)
+    if problem:
+        what, tail = problem
+        raise ParseError(f"Line {lineno}: {what} for '{identifier}'{tail}")
+    return template
+
+
+def _make_field(identifier, template):
+    """Return a new field dict for identifier from a shared template."""
+    field = {'id': identifier, **template}  # built at its final size in one go
+    if 'items' in field:
+        field['items'] = list(field['items'])  # callers get their own list
+    return field
+
+
+class _BadSpec(Exception):
+    """A type_spec problem: args are (what, tail) around the quoted identifier."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _type_spec_template(type_spec):
+    """Return (template, None) or (None, (what, tail)) for a type_spec string.
+
+    The same type specs come round on every re-parse while the user edits,
+    so results are memoized.  Templates are shared: never mutate them.
+    Errors are returned rather than raised, so they are cached too and the
+    caller can add the line number and identifier.
+    """
+    try:
+        return _build_template(type_spec), None
+    except _BadSpec as e:
+        return None, e.args
 
 
-def _parse_type_spec(type_spec, identifier, lineno):
-    """Parse a type_spec string into a field dict (without 'id' key)."""
-    if type_spec == 'bool':
-        return {'type': 'bool'}
+def _build_template(type_spec):
+    m = _TYPE_SPEC_RE.fullmatch(type_spec)
+    if m is None:
+        raise _BadSpec("malformed fixed value", " (must be a quoted string)")
 
-    if type_spec == 'date':
-        return {'type': 'date'}
+    if m['fixed'] is not None:
+        return {'type': 'fixed', 'value': m['fixed']}
 
-    if type_spec == 'time':
-        return {'type': 'time'}
+    type_name = m['name']
+    params_str = m['params']
 
-    if type_spec.startswith('"'):
-        if not type_spec.endswith('"') or len(type_spec) < 2:
-            raise ParseError(
-                f"Line {lineno}: malformed fixed value for '{identifier}' (must be a quoted string)"
-            )
-        return {'type': 'fixed', 'value': type_spec[1:-1]}
+    if params_str is not None and not m['close']:
+        raise _BadSpec("malformed type parameters", " (missing '>')")
 
-    if '<' not in type_spec:
-        raise ParseError(f"Line {lineno}: unknown type '{type_spec}' for '{identifier}'")
+    handler = _TYPE_HANDLERS.get(type_name)
+    # bool/date/time take no <params>; every other type requires them.
+    if handler is None or (params_str is None) != (handler is _parse_nullary):
+        raise _BadSpec(f"unknown type '{type_name}'", "")
+    # The name is a slice of the spec; interned, it is the same object as the
+    # 'str', 'int', ... literals it is later compared with and looked up by.
+    return handler(sys.intern(type_name), params_str)
 
-    type_name, _, rest = type_spec.partition('<')
-    type_name = type_name.strip()
 
-    if not rest.endswith('>'):
-        raise ParseError(
-            f"Line {lineno}: malformed type parameters for '{identifier}' (missing '>')"
-        )
+def _parse_nullary(type_name, params_str):  # bool, date, time
+    return {'type': type_name}
 
-    params_str = rest[:-1]
 
-    if type_name == 'str':
-        return {'type': 'str', 'width': _parse_one_int(params_str, 'width', identifier, lineno)}
+def _parse_width(type_name, params_str):  # str, int, float
+    return {'type': type_name, 'width': _parse_one_int(params_str, 'width')}
 
-    if type_name == 'int':
-        return {'type': 'int', 'width': _parse_one_int(params_str, 'width', identifier, lineno)}
 
-    if type_name == 'float':
-        return {'type': 'float', 'width': _parse_one_int(params_str, 'width', identifier, lineno)}
+def _parse_width_height(type_name, params_str):  # text, json
+    w, h = _parse_two_ints(params_str)
+    return {'type': type_name, 'width': w, 'height': h}
 
-    if type_name == 'text':
-        w, h = _parse_two_ints(params_str, identifier, lineno)
-        return {'type': 'text', 'width': w, 'height': h}
 
-    if type_name == 'json':
-        w, h = _parse_two_ints(params_str, identifier, lineno)
-        return {'type': 'json', 'width': w, 'height': h}
+def _parse_choice(type_name, params_str):
+    items = tuple(map(str.strip, params_str.split(',')))  # split() never returns []
+    if '' in items:
+        raise _BadSpec("empty item in choice list", "")
+    return {'type': 'choice', 'items': items}
 
-    if type_name == 'choice':
-        items = [item.strip() for item in params_str.split(',')]
-        if not items or any(item == '' for item in items):
-            raise ParseError(
-                f"Line {lineno}: empty item in choice list for '{identifier}'"
-            )
-        return {'type': 'choice', 'items': items}
 
-    raise ParseError(f"Line {lineno}: unknown type '{type_name}' for '{identifier}'")
+# Type name -> function(type_name, params_str) returning the field template.
+# params_str is None for the types written without <...>.
+_TYPE_HANDLERS = {
+    'str':    _parse_width,
+    'int':    _parse_width,
+    'float':  _parse_width,
+    'text':   _parse_width_height,
+    'json':   _parse_width_height,
+    'choice': _parse_choice,
+    'bool':   _parse_nullary,
+    'date':   _parse_nullary,
+    'time':   _parse_nullary,
+}
 
 
-def _parse_one_int(s, param_name, identifier, lineno):
-    try:
-        v = int(s.strip())
-    except ValueError:
-        raise ParseError(
-            f"Line {lineno}: {param_name} must be an integer for '{identifier}'"
-        )
+def _parse_one_int(s, param_name):
+    m = _INT_PARAM_RE.fullmatch(s)
+    if m is None:
+        raise _BadSpec(f"{param_name} must be an integer", "")
+    v = int(m[1])
     if v < 1:
-        raise ParseError(
-            f"Line {lineno}: {param_name} must be >= 1 for '{identifier}'"
-        )
+        raise _BadSpec(f"{param_name} must be >= 1", "")
     return v
 
 
-def _parse_two_ints(s, identifier, lineno):
-    parts = s.split(',')
-    if len(parts) != 2:
-        raise ParseError(
-            f"Line {lineno}: expected <width,height> for '{identifier}'"
-        )
-    try:
-        w = int(parts[0].strip())
-        h = int(parts[1].strip())
-    except ValueError:
-        raise ParseError(
-            f"Line {lineno}: width and height must be integers for '{identifier}'"
-        )
+def _parse_two_ints(s):
+    m = _TWO_INT_PARAMS_RE.fullmatch(s)
+    if m is None:
+        if s.count(',') != 1:
+            raise _BadSpec("expected <width,height>", "")
+        raise _BadSpec("width and height must be integers", "")
+    w, h = int(m[1]), int(m[2])
     if w < 1 or h < 1:
-        raise ParseError(
-            f"Line {lineno}: width and height must be >= 1 for '{identifier}'"
-        )
+        raise _BadSpec("width and height must be >= 1", "")
     return w, h
@@ -2,10 +2,12 @@
 
 import json
 import os
+import re
+import time
 import uuid
 
 import pytest
-from form_producer.emitter import EmitError, emit_message
+from form_producer.emitter import EmitError, emit_message, emit_messages
 
 
 def test_emits_json_file(tmp_path):
@@ -59,6 +61,24 @@ def test_timestamp_is_string(tmp_path):
     assert isinstance(data["timestamp"], str)
 
 
+def test_file_is_utf8_with_trailing_newline(tmp_path):
+    outbox = str(tmp_path / "OUTBOX")
+    filename = emit_message({"name": "Zoë"}, "ch", outbox)
+    raw = (tmp_path / "OUTBOX" / filename).read_bytes()
+    assert raw.endswith(b"\n")
+    assert "Zoë".encode("utf-8") in raw  # written as-is, not \u-escaped
+
+
+def test_timestamp_is_unix_seconds_with_six_decimals(tmp_path):
+    outbox = str(tmp_path / "OUTBOX")
+    before = time.time()
+    filename = emit_message({}, "ch", outbox)
+    with open(os.path.join(outbox, filename), encoding="utf-8") as f:
+        ts = json.load(f)["timestamp"]
+    assert re.fullmatch(r"\d+\.\d{6}", ts)
+    assert abs(float(ts) - before) < 60
+
+
 def test_filename_is_uuid4(tmp_path):
     outbox = str(tmp_path / "OUTBOX")
     filename = emit_message({}, "ch", outbox)
@@ -67,6 +87,30 @@ def test_filename_is_uuid4(tmp_path):
     assert str(parsed) == stem
 
 
+def test_uuid4_strings_are_valid_and_unique_across_refills():
+    from form_producer.emitter import _uuid4_str
+    names = [_uuid4_str() for _ in range(1000)]  # > one 4 KiB buffer
+    assert len(set(names)) == len(names)
+    for name in names[::97]:
+        assert str(uuid.UUID(name, version=4)) == name
+
+
+def test_emit_messages_writes_one_file_per_signal(tmp_path):
+    outbox = str(tmp_path / "OUTBOX")
+    signals = [{"n": i} for i in range(300)]  # more names than one 4 KiB draw
+    filenames = emit_messages(signals, "bulk", outbox)
+    assert len(set(filenames)) == len(signals)
+    for signal, filename in zip(signals, filenames):
+        with open(os.path.join(outbox, filename), encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["channel"] == "bulk"
+        assert data["signal"] == signal
+
+
+def test_emit_messages_empty(tmp_path):
+    assert emit_messages([], "ch", str(tmp_path / "OUTBOX")) == []
+
+
 def test_creates_outbox_if_missing(tmp_path):
     outbox = str(tmp_path / "deep" / "OUTBOX")
     assert not os.path.exists(outbox)
@@ -74,6 +118,15 @@ def test_creates_outbox_if_missing(tmp_path):
     assert os.path.isdir(outbox)
 
 
+def test_recreates_outbox_removed_after_first_emit(tmp_path):
+    outbox = str(tmp_path / "OUTBOX")
+    first = emit_message({}, "ch", outbox)
+    os.remove(os.path.join(outbox, first))
+    os.rmdir(outbox)
+    second = emit_message({}, "ch", outbox)
+    assert os.path.exists(os.path.join(outbox, second))
+
+
 def test_emit_error_on_bad_path():
     # Use a path that cannot be created (file exists where dir should be)
     import tempfile
@@ -81,3 +134,19 @@ def test_emit_error_on_bad_path():
         bad_outbox = f.name  # a file, not a directory
         with pytest.raises(EmitError):
             emit_message({}, "ch", os.path.join(bad_outbox, "subdir"))
+
+
+def test_short_writes_are_continued(tmp_path, monkeypatch):
+    real_write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, data[:7]))
+    outbox = str(tmp_path / "OUTBOX")
+    fname = emit_message({"k": "a longer signal value"}, "ch", outbox)
+    monkeypatch.undo()
+    with open(os.path.join(outbox, fname), encoding="utf-8") as f:
+        assert json.load(f)["signal"] == {"k": "a longer signal value"}
+
+
+def test_emit_error_when_write_makes_no_progress(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "write", lambda fd, data: 0)
+    with pytest.raises(EmitError):
+        emit_message({}, "ch", str(tmp_path / "OUTBOX"))
@@ -39,6 +39,21 @@ def test_skips_incomplete_json(tmp_path):
     assert scan_inbox(str(tmp_path)) == []
 
 
+def test_skips_empty_and_half_written_files_without_parsing(tmp_path, monkeypatch):
+    import form_producer.inbox as inbox
+    calls = []
+    monkeypatch.setattr(inbox, "loads", lambda raw: calls.append(raw))
+    (tmp_path / "empty.json").write_bytes(b"")
+    (tmp_path / "half.json").write_bytes(b'{"channel": "te')
+    assert scan_inbox(str(tmp_path)) == []
+    assert calls == []
+
+
+def test_accepts_trailing_whitespace(tmp_path):
+    (tmp_path / "msg.json").write_bytes(b'{"channel": "text"}\r\n  ')
+    assert [data for _, data in scan_inbox(str(tmp_path))] == [{"channel": "text"}]
+
+
 def test_skips_json_array(tmp_path):
     (tmp_path / "array.json").write_text('[1, 2, 3]', encoding="utf-8")
     assert scan_inbox(str(tmp_path)) == []
@@ -57,6 +72,14 @@ def test_returns_multiple_files_sorted(tmp_path):
     assert names == ["a.json", "b.json", "c.json"]
 
 
+def test_many_files_read_in_parallel_stay_sorted(tmp_path):
+    for i in range(20):
+        (tmp_path / f"m{i:02d}.json").write_text(json.dumps({"n": i}), encoding="utf-8")
+    (tmp_path / "m05.json").write_text('{"n": ', encoding="utf-8")  # still being written
+    results = scan_inbox(str(tmp_path))
+    assert [data["n"] for _, data in results] == [i for i in range(20) if i != 5]
+
+
 def test_incomplete_file_does_not_block_others(tmp_path):
     (tmp_path / "bad.json").write_text('{bad', encoding="utf-8")
     good = {"channel": "text", "signal": "ok", "timestamp": "1"}
@@ -66,6 +89,44 @@ def test_incomplete_file_does_not_block_others(tmp_path):
     assert results[0][1] == good
 
 
+def test_skips_directory_named_like_json(tmp_path):
+    (tmp_path / "folder.json").mkdir()
+    assert scan_inbox(str(tmp_path)) == []
+
+
+def test_skips_symlink(tmp_path):
+    target = tmp_path / "elsewhere.txt"
+    target.write_text(json.dumps({"channel": "text", "signal": "x"}), encoding="utf-8")
+    try:
+        os.symlink(target, tmp_path / "link.json")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not available")
+    assert scan_inbox(str(tmp_path)) == []
+
+
+def test_skips_invalid_utf8(tmp_path):
+    (tmp_path / "bad.json").write_bytes(b'{"signal": "\xff"}')
+    assert scan_inbox(str(tmp_path)) == []
+
+
+def test_unchanged_file_is_not_reparsed(tmp_path, monkeypatch):
+    import form_producer.inbox as inbox
+    calls = []
+    real_loads = inbox.loads
+    monkeypatch.setattr(inbox, "loads", lambda raw: calls.append(raw) or real_loads(raw))
+
+    path = tmp_path / "partial.json"
+    path.write_text('{"channel": "text", "x": {}', encoding="utf-8")  # ends in '}'; read and parsed
+    assert scan_inbox(str(tmp_path)) == []
+    assert scan_inbox(str(tmp_path)) == []
+    assert len(calls) == 1
+
+    msg = {"channel": "text", "signal": "done"}
+    path.write_text(json.dumps(msg), encoding="utf-8")  # writer finished
+    assert [data for _, data in scan_inbox(str(tmp_path))] == [msg]
+    assert len(calls) == 2
+
+
 # ---------------------------------------------------------------------------
 # is_text_message
 # ---------------------------------------------------------------------------
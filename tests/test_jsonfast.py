@@ -0,0 +1,64 @@
+"""Unit tests for the JSON encoding helpers."""
+
+import json
+import math
+
+import pytest
+
+from form_producer import jsonfast
+from form_producer.jsonfast import dumps, dumps_bytes, loads
+
+
+def test_dumps_bytes_returns_bytes():
+    assert isinstance(dumps_bytes({"x": 1}), bytes)
+
+
+def test_dumps_bytes_round_trips():
+    obj = {"name": "Alice", "count": 3, "active": True, "tags": ["a", "b"], "none": None}
+    assert json.loads(dumps_bytes(obj)) == obj
+
+
+def test_dumps_bytes_indented():
+    assert dumps_bytes({"a": [1]}, indent=True).decode("utf-8") == '{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_dumps_bytes_does_not_escape_non_ascii():
+    assert "é".encode("utf-8") in dumps_bytes({"x": "é"})
+
+
+def test_dumps_bytes_big_integer():
+    assert json.loads(dumps_bytes({"n": 2 ** 70})) == {"n": 2 ** 70}
+
+
+def test_dumps_bytes_without_orjson(monkeypatch):
+    monkeypatch.setattr(jsonfast, "orjson", None)
+    assert json.loads(dumps_bytes({"x": "é"}, indent=True)) == {"x": "é"}
+
+
+def test_dumps_returns_str():
+    assert dumps({"x": "é"}) == dumps_bytes({"x": "é"}).decode("utf-8")
+
+
+def test_loads_bytes():
+    assert loads('{"x": "é", "n": [1, 2.5]}'.encode("utf-8")) == {"x": "é", "n": [1, 2.5]}
+
+
+def test_loads_accepts_nan_like_stdlib():
+    assert math.isnan(loads(b'{"x": NaN}')["x"])
+
+
+def test_loads_error_is_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        loads(b'{"x": ')
+
+
+def test_loads_without_orjson(monkeypatch):
+    monkeypatch.setattr(jsonfast, "orjson", None)
+    assert loads(b'{"x": 1}') == {"x": 1}
+
+
+def test_dumps_bytes_non_finite_floats_do_not_depend_on_orjson(monkeypatch):
+    obj = {"x": float("nan"), "y": [float("inf")], "z": None}
+    with_orjson = dumps_bytes(obj)
+    monkeypatch.setattr(jsonfast, "orjson", None)
+    assert with_orjson == dumps_bytes(obj) == b'{"x": NaN, "y": [Infinity], "z": null}'
@@ -127,6 +127,28 @@ def test_choice_items_trimmed():
     assert fields[0]["items"] == ["small", "large"]
 
 
+def test_identifier_may_contain_single_hyphens():
+    _, fields = parse_spec("first-name -- str<20>  # given name\n")
+    assert fields == [{"id": "first-name", "type": "str", "width": 20}]
+
+
+def test_reparse_returns_fresh_field_dicts():
+    text = "a -- choice<x,y>\nb -- str<10>\n"
+    _, first = parse_spec(text)
+    first[0]["items"].append("z")
+    first[1]["width"] = 99
+    _, second = parse_spec(text)
+    assert second[0]["items"] == ["x", "y"]
+    assert second[1]["width"] == 10
+
+
+def test_same_bad_type_spec_reports_each_identifier():
+    with pytest.raises(ParseError, match="Line 1: .*'first'"):
+        parse_spec("first -- str<0>\n")
+    with pytest.raises(ParseError, match="Line 2: .*'second'"):
+        parse_spec("\nsecond -- str<0>\n")
+
+
 # ---------------------------------------------------------------------------
 # Inline comments on field lines
 # ---------------------------------------------------------------------------
@@ -137,6 +159,11 @@ def test_inline_comment_stripped():
     assert fields[0]["width"] == 30
 
 
+def test_hash_inside_fixed_value_is_kept():
+    _, fields = parse_spec('tag -- "#urgent"  # leading hash\n')
+    assert fields[0] == {"id": "tag", "type": "fixed", "value": "#urgent"}
+
+
 # ---------------------------------------------------------------------------
 # Field ordering preserved
 # ---------------------------------------------------------------------------
@@ -201,6 +228,12 @@ def test_error_choice_empty_item():
         parse_spec("x -- choice<a,,b>\n")
 
 
+def test_parse_error_is_a_value_error():
+    with pytest.raises(ValueError, match="Line 1: missing '--'"):
+        parse_spec("just some words\n")
+
+
 def test_error_includes_line_number():
     with pytest.raises(ParseError, match="Line 2"):
         parse_spec("good -- str<10>\nbadline\n")
+